@@ -17,73 +17,345 @@ Requirements:
     pip install psutil matplotlib numpy
 """
 
+import os
 import psutil
+import re
+import sys
 import time
 import logging
-from datetime import datetime
-from collections import deque
+import logging.handlers
+import threading
+from collections import deque, namedtuple
+from functools import lru_cache, partial
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+import matplotlib.patheffects as path_effects
+from matplotlib.animation import ArtistAnimation
+from matplotlib.collections import PolyCollection
+from matplotlib.gridspec import GridSpec
 from matplotlib.widgets import Button, Slider, CheckButtons, TextBox
 import numpy as np
 
 # ---------- Configuration / Defaults ----------
 MAX_POINTS = 60                # number of data points to show on the charts
 DEFAULT_INTERVAL_MS = 1000     # update interval (in milliseconds)
+DISK_TTL_S = 30.0              # seconds a disk usage reading is reused (statvfs is slow-moving)
+PROC_SAMPLE_EVERY = 5          # count processes every N ticks (cached in between)
+FRAME_COST_WINDOW = 20         # recent frame costs kept for the adaptive redraw interval
+ADAPT_EVERY = 10               # re-evaluate the redraw interval every N frames
+MAX_INTERVAL_MS = 10000        # upper bound for the adaptive redraw interval
+YLIM_SHRINK_TOLERANCE = 0.1    # y-axis tops shrink only when they would drop by more than this fraction
+DRAW_COALESCE_MS = 50          # UI callbacks within this window share one full redraw
+SLIDER_DEBOUNCE_MS = 100       # interval slider commits after this long without movement
+FIRST_SAMPLE_S = 0.5           # cpu/network measuring window before the sampler's first sample
 
 # UI color palette
 COLORS = {
     'bg': '#0f1724',
+    'background': '#0f1724',
     'panel': '#0b1220',
     'text': '#dbeafe',
     'cpu': '#f97316',
     'mem': '#10b981',
+    'memory': '#10b981',
     'disk': '#60a5fa',
     'network': '#f472b6',
+    'process': '#a78bfa',
     'accent': '#60a5fa',
     'threshold': '#fb923c',
+    'alert': '#f87171',
+    'success': '#34d399',
     'alert_bg': '#1f2937'
 }
+# Bound once so the per-frame code skips the dict lookups
+_TEXT_COLOR = COLORS['text']
+_ACCENT_COLOR = COLORS['accent']
+_ALERT_COLOR = COLORS['alert']
+_SUCCESS_COLOR = COLORS['success']
+
+
+# (axes key, title) of the time-series panels
+PLOT_PANELS = (
+    ('cpu', 'CPU USAGE (%)'),
+    ('memory', 'MEMORY USAGE (%)'),
+    ('disk', 'DISK USAGE (%)'),
+    ('network', 'NETWORK TRAFFIC (MB/s)'),
+    ('process', 'ACTIVE PROCESSES'),
+)
+
+# Single-series panels: key -> (value label unit, lowest y-axis top). Percent panels keep
+# 100% in view (thresholds are capped at 100); the process count scales freely.
+VALUE_PANELS = {
+    'cpu': ('%', 105),
+    'memory': ('%', 105),
+    'disk': ('%', 105),
+    'process': ('', 0),
+}
+
+
+# Summary panel value lines, in display order (current status, then alert history)
+# (%-style: cheaper than str.format/f-strings for these small numeric labels)
+SUMMARY_LINE_FORMATS = (
+    "CPU Usage: %.1f%%",
+    "Memory Usage: %.1f%% (%s GB)",
+    "Disk Usage (/): %.1f%% (%s GB)",
+    "Active Processes: %s",
+    "Network Rate: ↑%.2fMB/s / ↓%.2fMB/s",
+    "Total Alerts Logged: %s",
+    "Last Alert Time: %s",
+)
+
+
+# Record layout of the metric history buffer (time as epoch seconds)
+# Percentages keep the exact values the alerts compare, so the plotted line and the
+# threshold fill agree with them; the process count fits in uint16.
+HISTORY_DTYPE = np.dtype([
+    ('time', 'f8'),
+    ('cpu', 'f8'),
+    ('memory', 'f8'),
+    ('disk', 'f8'),
+    ('network_sent', 'f4'),
+    ('network_recv', 'f4'),
+    ('process', 'u2'),
+])
+
+
+# Threshold TextBoxes: metric -> (label, min, max, multiplier from input unit, display format)
+THRESHOLD_SPECS = {
+    'cpu': ('CPU%:', 5, 100, 1, '{:.0f}'),
+    'memory': ('MEM%:', 5, 100, 1, '{:.0f}'),
+    'disk': ('DISK%:', 5, 100, 1, '{:.0f}'),
+    'network': ('NET(MB/s):', 0.1, 100, 1e6, '{:.1f}'), # Input in MB/s
+    'process': ('PROC:', 10, 500, 1, '{:.0f}'),
+}
 
-# Logging setup
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(levelname)s] %(message)s'
+
+# Threshold checks: (metric, threshold key, display scale, %-style message for value and limit,
+# then the matching log format, appended below)
+# Network rates and their threshold are bytes/s, shown in MB/s. Messages are only formatted
+# when an alert is logged or drawn, never for the comparison itself.
+ALERT_RULES = (
+    ('cpu', 'cpu', 1, 'CPU: %.1f%% > %.0f%%'),
+    ('memory', 'memory', 1, 'MEM: %.1f%% > %.0f%%'),
+    ('disk', 'disk', 1, 'DISK: %.1f%% > %.0f%%'),
+    ('network_sent', 'network', 1e6, 'NET SENT: %.2fMB/s > %.1fMB/s'),
+    ('network_recv', 'network', 1e6, 'NET RECV: %.2fMB/s > %.1fMB/s'),
+    ('process', 'process', 1, 'PROC: %d > %d'),
 )
+# Same rules with the log format precomputed, so no format string is built per alert
+ALERT_RULES = tuple(rule + ('Alert Triggered: ' + rule[3],) for rule in ALERT_RULES)
+
+
+# Plain non-negative decimal, as typed into the threshold boxes
+_NUMBER_RE = re.compile(r'^\s*(?:\d+(?:\.\d*)?|\.\d+)\s*$')
+
+
+def format_hms(seconds):
+    """Format a whole number of seconds as HH:MM:SS (hours may exceed 24)."""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def threshold_fill_verts(x, y, threshold):
+    """Polygon of the area where a polyline lies above a threshold, for a PolyCollection."""
+    x = np.asarray(x, dtype=float)
+    d = np.asarray(y, dtype=float) - threshold
+    cross = np.flatnonzero(d[:-1] * d[1:] < 0) # Segments that cross the threshold
+    x_cross = x[cross] + (x[cross + 1] - x[cross]) * d[cross] / (d[cross] - d[cross + 1])
+    xs = np.concatenate((x, x_cross))
+    order = np.argsort(xs, kind='stable')
+    top = np.column_stack((xs[order], np.concatenate((np.maximum(d, 0), np.zeros(cross.size)))[order] + threshold))
+    base = [[top[-1, 0], threshold], [top[0, 0], threshold]]
+    return np.vstack((top, base))
+
+
+HardwareInfo = namedtuple('HardwareInfo', 'cpu_physical cpu_logical memory_total_gb disk_total_gb')
+
+
+@lru_cache(maxsize=1)
+def read_hardware_info():
+    """Core counts and memory/disk totals (GB); read once per process, they don't change."""
+    try:
+        return HardwareInfo(
+            psutil.cpu_count(logical=False),
+            psutil.cpu_count(logical=True),
+            round(psutil.virtual_memory().total / (1024**3), 1),
+            round(psutil.disk_usage('/').total / (1024**3), 1),
+        )
+    except Exception as e:
+        logger.error("Error getting static system info: %s", e)
+        return HardwareInfo('N/A', 'N/A', 'N/A', 'N/A')
+
+
+class MeminfoReader:
+    """Linux fast path: total and available memory bytes via one pread of /proc/meminfo."""
+
+    _fd = None # Also covers __del__ after a failed open
+
+    def __init__(self, path='/proc/meminfo'):
+        self._fd = os.open(path, os.O_RDONLY)
+
+    def close(self):
+        """Close the file descriptor; safe to call more than once."""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+
+    def __del__(self):
+        self.close()
+
+    def read(self):
+        """Return (total, available) in bytes, or None if closed or the fields are missing."""
+        if self._fd is None:
+            return None
+        total = avail = None
+        for line in os.pread(self._fd, 4096, 0).split(b'\n'):
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1]) * 1024 # Reported in kB
+            elif line.startswith(b'MemAvailable:'):
+                avail = int(line.split()[1]) * 1024
+                break # Listed after MemTotal
+        if total is None or avail is None:
+            return None
+        return total, avail
+
+
+class BlitManager:
+    """Per-axes blitting: redraw and blit only the axes whose artists changed."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._artists = {}      # axes -> animated artists currently shown in it
+        self._backgrounds = {}  # axes -> cached background region
+        # Full draws (first show, resize, widget redraws) wipe animated artists and
+        # invalidate the cached regions, so re-capture and repaint after each one
+        self._cid = canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """Re-capture every axes background and paint the animated artists on top."""
+        for ax, artists in self._artists.items():
+            self._backgrounds[ax] = self.canvas.copy_from_bbox(ax.bbox)
+            for artist in artists:
+                if artist.axes is ax: # Skip artists removed since they were last blitted
+                    ax.draw_artist(artist)
+
+    def disconnect(self):
+        """Stop listening for draws and drop the cached backgrounds and artist references."""
+        self.canvas.mpl_disconnect(self._cid)
+        self._artists.clear()
+        self._backgrounds.clear()
+
+    def update(self, artists, full_redraw=False):
+        """Redraw the given artists, blitting only the axes they belong to."""
+        dirty = {}
+        for artist in artists:
+            artist.set_animated(True)
+            dirty.setdefault(artist.axes, []).append(artist)
+        self._artists.update(dirty)
+        if not dirty and not full_redraw:
+            return
+
+        if full_redraw or any(ax not in self._backgrounds for ax in dirty):
+            self.canvas.draw() # on_draw re-captures the backgrounds and paints everything
+            return
+
+        for ax, ax_artists in dirty.items():
+            self.canvas.restore_region(self._backgrounds[ax])
+            for artist in ax_artists:
+                ax.draw_artist(artist) # Hidden artists (e.g. toggled network lines) are skipped
+            # One blit per axes: a union of bboxes would span most of the figure, since the
+            # full-width status axes changes every frame
+            self.canvas.blit(ax.bbox)
+        self.canvas.flush_events()
+
+
+# Module logger; handlers are configured by the entry point, not at import time
+logger = logging.getLogger(__name__)
+# Full alert history goes to this child logger (a rotating file in __main__) instead of memory
+alert_logger = logger.getChild('alerts')
+
 class SystemMonitorDashboard:
-    def _init_(self):
+    def __init__(self):
         """Initialize dashboard with default settings."""
         self.thresholds = {
             'cpu': 80,
             'memory': 80,
             'disk': 80,
-            'network': 1000000,  # Threshold in bytes (1MB)
+            'network': 1000000,  # Threshold in bytes/s (1MB/s)
             'process': 200
         }
         self.update_interval = 2000  # Start with 2s updates
         self.max_data_points = 15
-        self.alerts = []
-        self.alert_history = []
-        self.metrics_history = {
-            'time': [],
-            'cpu': [],
-            'memory': [],
-            'disk': [],
-            'network_sent': [],
-            'network_recv': [],
-            'process': []
-        }
-        self.animation = None
+        self.alerts = deque(maxlen=8) # Most recent alerts shown in the panel
+        self.alert_count = 0 # Alerts raised since start (the history itself is logged)
+        self._alerts_changed = True # Alert panel text needs rebuilding
+        self.last_alert_time = None
+        # Mirrored ring buffer: every row is written twice, N slots apart, so the
+        # last N samples are always one contiguous view (see the history property).
+        self._ring = np.zeros(2 * self.max_data_points, dtype=HISTORY_DTYPE)
+        self._head = 0 # Slot the next sample is written to
+        self.history_count = 0 # Number of filled rows (grows to max_data_points)
+        self.latest_metrics = None # Most recent full-precision sample
+        self.timer = None
         self.paused = False
         self.show_network_sent = True
         self.show_network_recv = True
+        self._needs_full_redraw = False
+        self._built = False
+        self._suppress_submit = False
+        self._shut_down = False
+        self._boot_time = psutil.boot_time() # Constant for the life of the process
+        self._last_net = None # Network counters baseline, taken by the sampler thread
+        self._last_net_time = None
+        self._last_ts = None # Whole epoch second the clock texts were last formatted for
+        self._tick = 0 # Sample counter driving the slower process cadence
+        self._disk_cache = None
+        self._disk_time = None # Monotonic time of the cached disk reading
+        self._proc_cache = None
+        self._sampling_failed = False # Set while get_system_metrics keeps failing
+        self._frame_ms = deque(maxlen=FRAME_COST_WINDOW) # Wall time of recent update_dashboard calls
+        self._frames = 0 # Frames timed since the controller last (re)started
+        self._hardware_info = read_hardware_info()
+        try:
+            self._meminfo = MeminfoReader() if sys.platform.startswith('linux') else None
+        except OSError:
+            self._meminfo = None # No readable /proc; psutil covers it
+
+        # Background sampler: psutil calls run off the GUI thread and hand samples over a bounded
+        # deque (append/popleft are atomic, so no lock). If the UI falls behind, the oldest
+        # samples are dropped first; anything beyond one history window would never be shown.
+        self._samples = deque(maxlen=self.max_data_points)
+        self._stop_sampling = threading.Event()
+        self._sampling_enabled = threading.Event()
+        self._sampling_enabled.set()
+        self._first_sample = threading.Event() # Set once the sampler has queued a sample
+        self._sampler = threading.Thread(target=self.sample_loop, name='metrics-sampler', daemon=True)
+        self._sampler.start()
 
         self.create_dashboard()
-        logging.info("Dashboard initialized")
+        logger.info("Dashboard initialized")
 
     def create_dashboard(self):
-        """Create the dashboard layout with enhanced UI elements."""
-        self.fig = plt.figure(figsize=(18, 12), facecolor=COLORS['background'])
+        """Create the dashboard layout once; later calls just repaint the existing figure."""
+        if self._built:
+            self.fig.canvas.draw_idle()
+            return
+
+        # Fixed GridSpec geometry: no layout engine, so draws never trigger a relayout
+        # (layout='none' also ignores any autolayout/constrained_layout rcParams)
+        self.fig = plt.figure(figsize=(18, 12), facecolor=COLORS['background'], layout='none')
+        self.blitter = BlitManager(self.fig.canvas)
+        # Single-shot timers: one coalesces redraw requests from UI callbacks, the other
+        # debounces the interval slider so a drag commits once instead of per step
+        self._pending_draw = False
+        self._draw_timer = self.fig.canvas.new_timer(interval=DRAW_COALESCE_MS)
+        self._draw_timer.single_shot = True
+        self._draw_timer.add_callback(self._flush_draw)
+        self._pending_interval = None
+        self._slider_timer = self.fig.canvas.new_timer(interval=SLIDER_DEBOUNCE_MS)
+        self._slider_timer.single_shot = True
+        self._slider_timer.add_callback(self._commit_interval)
+        self.fig.canvas.mpl_connect('close_event', self.shutdown)
         self.fig.suptitle(
             'ADVANCED SYSTEM MONITORING DASHBOARD',
             fontsize=22,
@@ -111,49 +383,136 @@ class SystemMonitorDashboard:
             'controls': self.fig.add_subplot(self.gs[3, :], facecolor=COLORS['background'])
         }
 
-        # Configure plots with better styling
-        self.configure_plot(self.axes['cpu'], 'CPU USAGE (%)', COLORS['cpu'])
-        self.configure_plot(self.axes['memory'], 'MEMORY USAGE (%)', COLORS['memory'])
-        self.configure_plot(self.axes['disk'], 'DISK USAGE (%)', COLORS['disk'])
-        self.configure_plot(self.axes['network'], 'NETWORK TRAFFIC (MB)', COLORS['network'])
-        self.configure_plot(self.axes['process'], 'ACTIVE PROCESSES', COLORS['process'])
+        # Configure plots with better styling (done once; frames only touch the data artists)
+        for key, title in PLOT_PANELS:
+            self.configure_plot(self.axes[key], title, COLORS[key])
+        self.build_static_chrome()
+
+        # Persistent artists, updated in place every frame so they can be blitted
+        self.lines = {}
+        self.threshold_lines = {}
+        self.value_texts = {}
+        self.fills = {}
+        self._ylims = {}
+        self._x_index = np.arange(self.max_data_points) # Shared x values (sample index)
+        self.plot_updaters = {}
+        for key, (unit, y_floor) in VALUE_PANELS.items():
+            self.create_plot_artists(key, COLORS[key])
+            self.plot_updaters[key] = self.make_plot_updater(key, unit, y_floor)
+
+        net_ax = self.axes['network']
+        self.threshold_lines['network'] = net_ax.axhline(
+            y=self.thresholds['network'] / 1e6, color=COLORS['threshold'], linestyle='--', alpha=0.7, linewidth=1.5)
+        self.lines['network_sent'], = net_ax.plot(
+            [], [], color=COLORS['network'], linewidth=2.0, label='Sent',
+            marker='^', markersize=4, markerfacecolor=COLORS['background'], markeredgecolor=COLORS['network'])
+        self.lines['network_recv'], = net_ax.plot(
+            [], [], color=COLORS['accent'], linewidth=2.0, label='Recv',
+            marker='v', markersize=4, markerfacecolor=COLORS['background'], markeredgecolor=COLORS['accent'])
+        # Per-series value labels in the top-left corner (a legend would be rebuilt every frame)
+        self.network_labels = {
+            'sent': net_ax.text(0.02, 0.95, '', transform=net_ax.transAxes, color=COLORS['network'],
+                                fontsize=8, fontweight='bold', va='top'),
+            'recv': net_ax.text(0.02, 0.87, '', transform=net_ax.transAxes, color=COLORS['accent'],
+                                fontsize=8, fontweight='bold', va='top'),
+        }
+        # Scratch buffers for the MB/s series (Line2D copies its data, so they are reused per frame)
+        self._net_mb = {
+            'sent': np.empty(self.max_data_points, dtype=np.float32),
+            'recv': np.empty(self.max_data_points, dtype=np.float32),
+        }
 
         # Alert panel setup
         self.axes['alert'].set_title('ALERTS', color=COLORS['alert'], pad=10, fontsize=12, fontweight='bold')
         self.axes['alert'].axis('off')
-        self.alert_texts = []
+        # One Text artist for the whole panel; re-laid out only when the alert list changes
+        self.alert_block = self.axes['alert'].text(
+            0.5, 0.5, '', transform=self.axes['alert'].transAxes, fontsize=9)
 
         # Summary panel setup
         self.axes['summary'].set_title('SYSTEM SUMMARY', color=COLORS['accent'], pad=10, fontsize=12, fontweight='bold')
         self.axes['summary'].axis('off')
+        self.build_summary_panel()
 
         # Add enhanced controls and status bar
         self.add_control_panel()
         self.add_status_bar()
 
-        # Initial data collection to populate plots before animation starts
+        # Initial data collection to populate plots before the refresh timer starts. No blit
+        # background is cached yet, so this renders the whole figure once; later frames only
+        # blit the changed artists.
+        self._first_sample.wait(FIRST_SAMPLE_S + 1)
         self.update_dashboard(0)
-        logging.info("Dashboard UI created")
+        self._built = True
+        logger.info("Dashboard UI created")
 
     def configure_plot(self, ax, title, color):
         """Enhanced plot styling with better visuals."""
-        ax.clear()
         ax.set_title(title, color=color, pad=12, fontsize=12, fontweight='bold')
-        ax.set_xlabel('Time', color=COLORS['text'], fontsize=10)
-        ax.set_ylabel(title.split(' (')[0], color=COLORS['text'], fontsize=10)
-        ax.tick_params(colors=COLORS['text'], labelsize=9)
+        ax.set_xlabel('Samples', color=_TEXT_COLOR, fontsize=10)
+        ax.set_ylabel(title.split(' (')[0], color=_TEXT_COLOR, fontsize=10)
+        ax.tick_params(colors=_TEXT_COLOR, labelsize=9)
         ax.grid(True, alpha=0.2, linestyle='--')
         ax.set_facecolor(COLORS['panel'])
 
-        # Rotate x-labels and limit ticks for better readability
-        plt.setp(ax.get_xticklabels(), rotation=30, ha='right')
-        ax.xaxis.set_major_locator(plt.MaxNLocator(6))
-        ax.yaxis.set_major_locator(plt.MaxNLocator(5))
+    def build_static_chrome(self):
+        """One-shot tick locator, spine and x-window setup for all plot panels."""
+        for key, _ in PLOT_PANELS:
+            ax = self.axes[key]
+            # Fixed x window (sample index) so the axis never has to be re-laid out while blitting
+            ax.set_xlim(0, self.max_data_points - 1)
+
+            # Limit ticks and rotate x-labels for better readability. labelrotation is kept by
+            # tick_params for ticks created later; alignment is set once on the (fixed) tick labels.
+            ax.xaxis.set_major_locator(plt.MaxNLocator(6, integer=True))
+            ax.yaxis.set_major_locator(plt.MaxNLocator(5))
+            ax.tick_params(axis='x', labelrotation=30, pad=2)
+            for label in ax.get_xticklabels():
+                label.set_horizontalalignment('right')
+
+            # Border styling
+            for spine in ax.spines.values():
+                spine.set_color(COLORS[key])
+                spine.set_linewidth(1.5) # Slightly thinner border
+
+    def create_plot_artists(self, key, color):
+        """Create the line, threshold and value label artists for a metric plot once."""
+        ax = self.axes[key]
+        self.threshold_lines[key] = ax.axhline(
+            y=self.thresholds[key], color=COLORS['threshold'], linestyle='--', alpha=0.7, linewidth=1.5)
+        self.lines[key], = ax.plot(
+            [], [],
+            color=color,
+            linewidth=2.0, # Slightly thinner line
+            marker='o',
+            markersize=4, # Slightly smaller marker
+            markerfacecolor=COLORS['background'],
+            markeredgecolor=color,
+            markeredgewidth=1.0
+        )
+        # Latest value, pinned to the top-right corner so frames only change its text
+        self.value_texts[key] = ax.text(
+            0.98, 0.95, '',
+            transform=ax.transAxes,
+            ha='right', va='top',
+            color=color,
+            fontsize=9,
+            fontweight='bold'
+        )
+        # Shaded area above the threshold; its vertices are replaced in place every frame
+        self.fills[key] = ax.add_collection(
+            PolyCollection([], facecolor=_ALERT_COLOR, alpha=0.2, linewidth=0), autolim=False)
+
+    def set_ylim(self, key, y_min, y_max):
+        """Apply new y-limits only when they matter; flags a full redraw for the new tick labels."""
+        current = self._ylims.get(key)
+        if current is not None and current[0] == y_min and \
+                current[1] * (1 - YLIM_SHRINK_TOLERANCE) <= y_max <= current[1]:
+            return # Data still fits and the top would barely move
+        self._ylims[key] = (y_min, y_max)
+        self.axes[key].set_ylim(y_min, y_max)
+        self._needs_full_redraw = True
 
-        # Border styling
-        for spine in ax.spines.values():
-            spine.set_color(color)
-            spine.set_linewidth(1.5) # Slightly thinner border
     def add_control_panel(self):
         """Enhanced control panel with more interactive elements."""
         # Use the dedicated controls axis, turn off its own ticks/spines
@@ -189,7 +548,7 @@ class SystemMonitorDashboard:
         )
         self.interval_slider.label.set_color(COLORS['text'])
         self.interval_slider.valtext.set_color(COLORS['text'])
-        self.interval_slider.on_changed(self.update_interval_changed)
+        self.interval_slider.on_changed(self.schedule_interval_change)
 
         # Network visibility toggle - CORRECTED
         ax_network_toggle = self.fig.add_axes([0.45, control_y_pos, 0.1, 0.05]) # Adjusted position
@@ -209,21 +568,11 @@ class SystemMonitorDashboard:
         threshold_base_x = 0.58
         threshold_width = 0.06
         threshold_spacing = 0.07
-        positions = [
-            # (metric, label, min_val, max_val, multiplier) - Multiplier for display/input units
-            ('cpu', 'CPU%:', 5, 100, 1),
-            ('memory', 'MEM%:', 5, 100, 1),
-            ('disk', 'DISK%:', 5, 100, 1),
-            ('network', 'NET(MB):', 0.1, 100, 1e6), # Input in MB
-            ('process', 'PROC:', 10, 500, 1)
-        ]
-
-        for i, (metric, label, min_val, max_val, multiplier) in enumerate(positions):
+        for i, (metric, (label, _, _, multiplier, display_fmt)) in enumerate(THRESHOLD_SPECS.items()):
             xpos = threshold_base_x + i * threshold_spacing
             ax_box = self.fig.add_axes([xpos, control_y_pos, threshold_width, 0.04])
-            initial_val = self.thresholds[metric] / multiplier # Display in appropriate unit
             self.threshold_inputs[metric] = TextBox(
-                ax_box, label, initial=f"{initial_val:.1f}" if metric=='network' else f"{int(initial_val)}",
+                ax_box, label, initial=display_fmt.format(self.thresholds[metric] / multiplier), # Display in input unit
                 color=COLORS['panel'],
                 hovercolor=COLORS['panel'],
                 label_pad=label_pad # Adjusted padding
@@ -231,73 +580,95 @@ class SystemMonitorDashboard:
             self.threshold_inputs[metric].label.set_color(COLORS['text'])
             self.threshold_inputs[metric].label.set_fontsize(9)
             self.threshold_inputs[metric].text_disp.set_color(COLORS['text'])
-            # Use a nested function to capture metric and multiplier correctly in lambda
-            def create_submit_handler(m, mult):
-                return lambda text: self.update_threshold(m, text, mult)
-            self.threshold_inputs[metric].on_submit(create_submit_handler(metric, multiplier))
+            self.threshold_inputs[metric].on_submit(partial(self.update_threshold, metric))
 
 
     def add_status_bar(self):
-        """Enhanced status bar using the controls axis."""
-        ax = self.axes['controls']
+        """Enhanced status bar in its own axes so its texts can be blitted."""
+        # A dedicated full-width strip at the bottom; blitting needs every animated artist to live in an axes
+        ax = self.fig.add_axes([0, 0, 1, 0.04], facecolor=COLORS['background'])
+        ax.axis('off')
+        self.axes['status'] = ax
         # Use figure coordinates for precise positioning at the very bottom
         status_y_pos = 0.015
 
         # Timestamp
-        self.timestamp_text = self.fig.text(
-            0.02, status_y_pos, # Position relative to figure
-            datetime.now().strftime('Last Update: %Y-%m-%d %H:%M:%S'),
-            color=COLORS['text'],
-            fontsize=9,
-            ha='left' # Horizontal alignment
-        )
+        self.timestamp_text = self.add_status_field(
+            ax, 0.02, status_y_pos, 'Last Update: ', time.strftime('%Y-%m-%d %H:%M:%S'), COLORS['text'])
 
         # Status text
-        self.status_text = self.fig.text(
+        self.status_text = ax.text(
             0.35, status_y_pos, # Position relative to figure
             'Status: [ACTIVE]',
             color=COLORS['success'],
             fontsize=9,
             fontweight='bold',
-            ha='left'
+            ha='left',
+            transform=self.fig.transFigure
         )
 
-        # Uptime - CORRECTED
-        self.uptime_text = self.fig.text(
-            0.65, status_y_pos, # Position relative to figure
-            f"Uptime: {time.strftime('%H:%M:%S', time.gmtime(time.time() - psutil.boot_time()))}", # CORRECTED: Added closing parenthesis
-            color=COLORS['text'],
-            fontsize=9,
-            ha='left'
-        )
+        # Uptime
+        self.uptime_text = self.add_status_field(
+            ax, 0.65, status_y_pos, 'Uptime: ', format_hms(int(time.time() - self._boot_time)), COLORS['text'])
 
         # Refresh rate indicator
-        self.refresh_text = self.fig.text(
-            0.85, status_y_pos, # Position relative to figure
-            f"Refresh: {self.update_interval/1000:.1f}s",
-            color=COLORS['accent'],
+        self.refresh_text = self.add_status_field(
+            ax, 0.85, status_y_pos, 'Refresh: ', f"{self.update_interval/1000:.1f}s", COLORS['accent'])
+        # Every changing text in the status axes, redrawn together whenever any of them is blitted
+        self.status_artists = (self.timestamp_text, self.status_text, self.uptime_text, self.refresh_text)
+
+    def add_status_field(self, ax, x, y, label, value, color):
+        """Add a status bar field as a static label plus a value text; returns the value text."""
+        prefix = ax.text(x, y, label, color=color, fontsize=9, ha='left', transform=self.fig.transFigure)
+        return ax.annotate(
+            value,
+            xy=(1, 0), xycoords=prefix, # Bottom-right corner of the label
+            color=color,
             fontsize=9,
-            ha='left'
+            ha='left', va='bottom'
         )
+
+    def request_draw(self):
+        """Schedule one full redraw, shared by every UI change made within DRAW_COALESCE_MS."""
+        if not self._pending_draw:
+            self._pending_draw = True
+            self._draw_timer.start()
+
+    def _flush_draw(self):
+        self._pending_draw = False
+        self.fig.canvas.draw_idle()
+
+    def schedule_interval_change(self, val):
+        """Slider callback: (re)start the debounce timer so only the settled value is applied."""
+        self._pending_interval = val
+        self._slider_timer.stop()
+        self._slider_timer.start()
+
+    def _commit_interval(self):
+        if self._pending_interval is not None:
+            val, self._pending_interval = self._pending_interval, None
+            self.update_interval_changed(val)
+
     def toggle_pause(self, event):
         """Toggle pause/resume of updates."""
         self.paused = not self.paused
         if self.paused:
+            self._sampling_enabled.clear()
             self.pause_button.label.set_text('Resume')
             self.status_text.set_text("Status: [PAUSED]")
             self.status_text.set_color(COLORS['alert'])
-            if self.animation:
-                self.animation.event_source.stop()
-            logging.info("Dashboard paused")
+            if self.timer:
+                self.timer.stop()
+            logger.info("Dashboard paused")
         else:
+            self._sampling_enabled.set()
             self.pause_button.label.set_text('Pause')
             self.status_text.set_text("Status: [RUNNING]")
             self.status_text.set_color(COLORS['success'])
-            if self.animation:
-                self.animation.event_source.start()
-            logging.info("Dashboard resumed")
-        # self.fig.canvas.draw_idle() # Use draw_idle for better performance with widgets
-        plt.draw() # Keep plt.draw for simplicity here
+            if self.timer:
+                self.timer.start()
+            logger.info("Dashboard resumed")
+        self.request_draw()
 
 
     def toggle_network_visibility(self, label):
@@ -312,9 +683,10 @@ class SystemMonitorDashboard:
         # elif label == ' Recv': # Compare with the actual label text
         #      self.show_network_recv = not self.show_network_recv
 
-        self.update_network_plot() # Redraw only the network plot
-        self.fig.canvas.draw_idle() # Update the canvas efficiently
-        logging.info(f"Network visibility updated: Sent={self.show_network_sent}, Recv={self.show_network_recv}")
+        # Redraw only the network plot
+        self.blitter.update(self.update_network_plot(), full_redraw=self._needs_full_redraw)
+        self._needs_full_redraw = False
+        logger.info("Network visibility updated: Sent=%s, Recv=%s", self.show_network_sent, self.show_network_recv)
 
 
     def update_interval_changed(self, val):
@@ -325,86 +697,121 @@ class SystemMonitorDashboard:
                 self.update_interval = int(new_interval) # Store as int ms
                 self.status_text.set_text(f"Status: [INTERVAL UPDATED]")
                 self.status_text.set_color(COLORS['success'])
-                self.refresh_text.set_text(f"Refresh: {val:.1f}s")
-                if self.animation and not self.paused:
-                    self.animation.event_source.stop() # Stop and restart timer
-                    self.animation.event_source.interval = self.update_interval
-                    self.animation.event_source.start()
-                logging.info(f"Update interval changed to {self.update_interval} ms")
+                self.refresh_text.set_text(f"{val:.1f}s")
+                self._frame_ms.clear() # Restart the adaptive controller from the user's choice
+                self._frames = 0
+                if self.timer:
+                    self.timer.interval = self.update_interval # Takes effect on the running timer
+                logger.info("Update interval changed to %d ms", self.update_interval)
             else:
                 # Reset slider to previous value if out of bounds (optional)
                 # self.interval_slider.set_val(self.update_interval/1000)
                 self.status_text.set_text("Status: [INTERVAL OUT OF RANGE]")
                 self.status_text.set_color(COLORS['alert'])
-                logging.warning(f"Invalid interval requested: {val}s")
+                logger.warning("Invalid interval requested: %ss", val)
         except ValueError:
             self.status_text.set_text("Status: [INVALID INTERVAL INPUT]")
             self.status_text.set_color(COLORS['alert'])
-            logging.error("Invalid non-numeric input for interval slider")
-        self.fig.canvas.draw_idle()
+            logger.error("Invalid non-numeric input for interval slider")
+        self.request_draw()
 
 
-    def update_threshold(self, metric, text, multiplier):
-        """Update thresholds from TextBox input with validation."""
+    def set_threshold_text(self, metric, text):
+        """Replace a threshold box's text without re-submitting it through update_threshold."""
+        self._suppress_submit = True
         try:
-            input_val = float(text)
-            new_val = input_val * multiplier # Convert input unit to base unit (bytes for network)
-
-            # Basic validation (can add more specific ranges per metric)
-            if new_val > 0:
-                self.thresholds[metric] = new_val
-                self.status_text.set_text(f"Status: [{metric.upper()} THRESHOLD UPDATED]")
-                self.status_text.set_color(COLORS['success'])
-                logging.info(f"Threshold updated: {metric} = {new_val} (Input: {text})")
-                # Redraw relevant plot to show new threshold line immediately
-                if metric == 'cpu': self.update_cpu_plot()
-                elif metric == 'memory': self.update_memory_plot()
-                elif metric == 'disk': self.update_disk_plot()
-                elif metric == 'network': self.update_network_plot()
-                elif metric == 'process': self.update_process_plot()
-                self.fig.canvas.draw_idle()
-            else:
-                self.status_text.set_text("Status: [VALUE MUST BE POSITIVE]")
-                self.status_text.set_color(COLORS['alert'])
-                # Reset text box to current valid threshold value
-                self.threshold_inputs[metric].set_val(f"{self.thresholds[metric]/multiplier:.1f}" if metric=='network' else f"{int(self.thresholds[metric]/multiplier)}")
-                logging.warning(f"Invalid threshold value for {metric}: {text}")
-        except ValueError:
+            self.threshold_inputs[metric].set_val(text)
+        finally:
+            self._suppress_submit = False
+
+    def update_threshold(self, metric, text):
+        """Update a threshold from TextBox input, clamped to the metric's allowed range."""
+        if self._suppress_submit:
+            return # Our own set_val echo below; the value is already being applied
+        _, min_val, max_val, multiplier, display_fmt = THRESHOLD_SPECS[metric]
+        if not _NUMBER_RE.match(text):
             self.status_text.set_text("Status: [INVALID THRESHOLD INPUT]")
             self.status_text.set_color(COLORS['alert'])
             # Reset text box to current valid threshold value
-            self.threshold_inputs[metric].set_val(f"{self.thresholds[metric]/multiplier:.1f}" if metric=='network' else f"{int(self.thresholds[metric]/multiplier)}")
-            logging.error(f"Invalid non-numeric input for {metric} threshold: {text}")
-        self.fig.canvas.draw_idle()
+            self.set_threshold_text(metric, display_fmt.format(self.thresholds[metric] / multiplier))
+            logger.error("Invalid non-numeric input for %s threshold: %s", metric, text)
+            self.request_draw()
+            return
+
+        input_val = float(text)
+        clamped = max(min_val, min(max_val, input_val))
+        if clamped != input_val:
+            logger.warning("Threshold for %s clamped to %s (Input: %s)", metric, clamped, text)
+            self.set_threshold_text(metric, display_fmt.format(clamped)) # Show the in-range value
+
+        new_val = clamped * multiplier # Convert input unit to base unit (bytes/s for network)
+        if abs(new_val - self.thresholds[metric]) < 1e-9:
+            return # Unchanged (e.g. focus left the box without an edit); nothing to redraw
+
+        self.thresholds[metric] = new_val
+        self.status_text.set_text(f"Status: [{metric.upper()} THRESHOLD UPDATED]")
+        self.status_text.set_color(COLORS['success'])
+        logger.info("Threshold updated: %s = %s (Input: %s)", metric, new_val, text)
+        # The threshold line is static chrome baked into the blit background, so moving it
+        # takes one full redraw; the panel's fill and limits are refreshed in the same pass
+        self.threshold_lines[metric].set_ydata([new_val / multiplier] * 2)
+        artists = getattr(self, f'update_{metric}_plot')()
+        self.blitter.update(artists + list(self.status_artists), full_redraw=True)
+        self._needs_full_redraw = False
 
 
     def get_system_metrics(self):
         """Collect system metrics with error handling."""
         try:
-            # Get network counters before CPU percent to measure over the interval
-            net_before = psutil.net_io_counters()
-            cpu_usage = psutil.cpu_percent(interval=0.5) # Non-blocking interval
-            net_after = psutil.net_io_counters()
-
-            # Calculate network usage delta over the interval (approximate rate)
-            # Note: This gives total bytes since boot, not rate. Rate calculation needs previous values.
-            # Storing totals is simpler for this example. Thresholds apply to total usage reported.
-            # For rate, you'd store previous values and subtract.
-            # Let's keep it simple and use the total bytes reported by psutil for now.
-            # The threshold check will compare these totals.
+            cpu_usage = psutil.cpu_percent(percpu=False, interval=None) # Non-blocking: usage since the previous call
+
+            stamp = time.time() # One wall-clock read per sample, shared with the history row
+            # Network rate from the delta against the previous tick's counters (one read per tick)
+            now = time.monotonic()
+            net = psutil.net_io_counters()
+            dt = max(now - self._last_net_time, 1e-3)
+            sent_rate = (net.bytes_sent - self._last_net.bytes_sent) / dt
+            recv_rate = (net.bytes_recv - self._last_net.bytes_recv) / dt
+            self._last_net, self._last_net_time = net, now
+
+            # Disk usage and process enumeration are slow-moving and comparatively expensive
+            if self._disk_time is None or now - self._disk_time >= DISK_TTL_S:
+                self._disk_cache = psutil.disk_usage('/') # Reused for percent and used bytes
+                self._disk_time = now
+            if self._tick % PROC_SAMPLE_EVERY == 0:
+                self._proc_cache = len(psutil.pids())
+            self._tick += 1
+            mem = self._meminfo.read() if self._meminfo else None
+            if mem:
+                total, avail = mem
+                memory_percent, memory_used = (total - avail) / total * 100, total - avail
+            else:
+                vmem = psutil.virtual_memory()
+                memory_percent, memory_used = vmem.percent, vmem.used
 
+            if self._sampling_failed:
+                self._sampling_failed = False
+                logger.info("System metrics collection recovered")
             return {
-                'time': datetime.now().strftime('%H:%M:%S'),
+                'time': time.strftime('%H:%M:%S', time.localtime(stamp)),
+                'timestamp': stamp,
                 'cpu': cpu_usage,
-                'memory': psutil.virtual_memory().percent,
-                'disk': psutil.disk_usage('/').percent,
-                'process': len(psutil.pids()),
-                'network_sent': net_after.bytes_sent,
-                'network_recv': net_after.bytes_recv
+                'memory': memory_percent,
+                'memory_used': memory_used, # bytes
+                'disk': self._disk_cache.percent,
+                'disk_used': self._disk_cache.used, # bytes
+                'process': self._proc_cache,
+                'network_sent': sent_rate, # bytes/s
+                'network_recv': recv_rate  # bytes/s
             }
         except Exception as e:
-            logging.error(f"Error collecting system metrics: {str(e)}")
-            # Optionally return last known good values or None/default dict
+            # A persistent failure (e.g. a restricted container) would otherwise log every
+            # sample; report the first one in full and keep the rest at debug level
+            if not self._sampling_failed:
+                self._sampling_failed = True
+                logger.error("Error collecting system metrics: %s", e, exc_info=True)
+            else:
+                logger.debug("Error collecting system metrics: %s", e)
             return None
 
 
@@ -413,100 +820,69 @@ class SystemMonitorDashboard:
         if not metrics:
             return
 
-        new_alerts = []
+        raised = 0
         timestamp = metrics['time'] # Use the timestamp from metrics collection
 
-        if metrics['cpu'] > self.thresholds['cpu']:
-            alert_msg = f"CPU: {metrics['cpu']:.1f}% > {self.thresholds['cpu']:.0f}%"
-            new_alerts.append(alert_msg)
-            logging.warning(f"Alert Triggered: {alert_msg}")
-
-        if metrics['memory'] > self.thresholds['memory']:
-            alert_msg = f"MEM: {metrics['memory']:.1f}% > {self.thresholds['memory']:.0f}%"
-            new_alerts.append(alert_msg)
-            logging.warning(f"Alert Triggered: {alert_msg}")
-
-        if metrics['disk'] > self.thresholds['disk']:
-            alert_msg = f"DISK: {metrics['disk']:.1f}% > {self.thresholds['disk']:.0f}%"
-            new_alerts.append(alert_msg)
-            logging.warning(f"Alert Triggered: {alert_msg}")
-
-        # Network check (compare total bytes, convert threshold to MB for message)
-        net_thresh_mb = self.thresholds['network'] / 1e6
-        # Note: Comparing total bytes sent/received since boot might not be ideal for alerts.
-        # A better approach would be rate (MB/s), which requires storing previous values.
-        # Keeping the current simpler logic for this example.
-        # Let's change the check to be more meaningful, e.g., if *increase* per interval is high
-        # For now, sticking to the original logic comparing totals:
-        if metrics['network_sent'] > self.thresholds['network']:
-            sent_mb = metrics['network_sent'] / 1e6
-            # alert_msg = f"NET SENT: {sent_mb:.1f}MB > {net_thresh_mb:.1f}MB (Total)" # Indicate it's total
-            # new_alerts.append(alert_msg)
-            # logging.warning(f"Alert Triggered: {alert_msg}")
-            pass # Deactivate simple total check for network as it's less useful
-
-        if metrics['network_recv'] > self.thresholds['network']:
-            recv_mb = metrics['network_recv'] / 1e6
-            # alert_msg = f"NET RECV: {recv_mb:.1f}MB > {net_thresh_mb:.1f}MB (Total)" # Indicate it's total
-            # new_alerts.append(alert_msg)
-            # logging.warning(f"Alert Triggered: {alert_msg}")
-            pass # Deactivate simple total check for network
-
-        if metrics['process'] > self.thresholds['process']:
-            alert_msg = f"PROC: {metrics['process']} > {self.thresholds['process']}"
-            new_alerts.append(alert_msg)
-            logging.warning(f"Alert Triggered: {alert_msg}")
-
-        if new_alerts:
-            alert_tuples = [(timestamp, alert) for alert in new_alerts]
-            self.alerts.extend(alert_tuples)
-            self.alert_history.extend(alert_tuples) # Keep full history
-            self.alerts = self.alerts[-8:]  # Limit displayed alerts
+        thresholds = self.thresholds
+        for key, threshold_key, scale, message, log_format in ALERT_RULES:
+            value = metrics[key]
+            limit = thresholds[threshold_key]
+            if value > limit:
+                args = (value / scale, limit / scale)
+                # Kept unformatted; the panel renders it, logging formats it only if enabled
+                self.alerts.append((timestamp, message, args))
+                alert_logger.warning(log_format, *args)
+                raised += 1
+
+        if raised:
+            self._alerts_changed = True
+            self.alert_count += raised
+            self.last_alert_time = timestamp
             self.status_text.set_text("Status: [ALERT TRIGGERED]")
             self.status_text.set_color(COLORS['alert'])
-            # Update alert panel immediately
-            self.update_alert_panel()
 
 
-    def update_dashboard(self, frame):
-        """Main update function called by FuncAnimation."""
+    def update_dashboard(self, frame=None):
+        """Main update function called by the refresh timer; returns the artists it redrew."""
         if self.paused:
-            # Return list of artists that need updating (empty if paused and not using blit)
+            # Bail out before draining, sampling or drawing anything
             return []
 
-        metrics = self.get_system_metrics()
-        if not metrics:
-            self.status_text.set_text("Status: [METRICS ERROR]")
-            self.status_text.set_color(COLORS['alert'])
-            # Decide how to handle missing metrics in plots (e.g., skip update, show gap)
-            return [] # Skip update if metrics failed
-
-        # Check thresholds before updating history (so history reflects state *before* alert check)
-        self.check_thresholds(metrics) # This might update status text
-
-        # Update history (only if metrics were successful)
-        current_time = metrics['time'] # Use consistent time
-        self.metrics_history['time'].append(current_time)
-        self.metrics_history['cpu'].append(metrics['cpu'])
-        self.metrics_history['memory'].append(metrics['memory'])
-        self.metrics_history['disk'].append(metrics['disk'])
-        self.metrics_history['network_sent'].append(metrics['network_sent'])
-        self.metrics_history['network_recv'].append(metrics['network_recv'])
-        self.metrics_history['process'].append(metrics['process'])
-
-        # Trim history to max_data_points
-        for key in self.metrics_history:
-            if len(self.metrics_history[key]) > self.max_data_points:
-                self.metrics_history[key] = self.metrics_history[key][-self.max_data_points:]
+        # Drain whatever the sampler thread produced since the last frame
+        metrics = None
+        while True:
+            try:
+                sample = self._samples.popleft()
+            except IndexError:
+                break
+            if not sample:
+                self.status_text.set_text("Status: [METRICS ERROR]")
+                self.status_text.set_color(_ALERT_COLOR)
+                continue
+            # Check thresholds before updating history (so history reflects state *before* alert check)
+            self.check_thresholds(sample) # This might update status text
+            self.push_sample(sample)
+            metrics = sample
+        if metrics is not None:
+            self.latest_metrics = metrics
+
+        if metrics is None:
+            # No new data (or only failed samples): the panels on screen stay as they are
+            if self.status_text.stale:
+                self.blitter.update(self.status_artists)
+            return []
 
         # Update status bar text elements (only if not paused and no alert triggered/metric error)
         if not self.paused and self.status_text.get_text() not in ["Status: [ALERT TRIGGERED]", "Status: [METRICS ERROR]"]:
              self.status_text.set_text("Status: [RUNNING]")
-             self.status_text.set_color(COLORS['success'])
+             self.status_text.set_color(_SUCCESS_COLOR)
 
-        self.timestamp_text.set_text(f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        # Uptime update can be less frequent, but ok here for simplicity
-        self.uptime_text.set_text(f"Uptime: {time.strftime('%H:%M:%S', time.gmtime(time.time() - psutil.boot_time()))}")
+        # Re-format the clock texts only when the displayed second changes
+        now = int(time.time())
+        if now != self._last_ts:
+            self._last_ts = now
+            self.timestamp_text.set_text(time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+            self.uptime_text.set_text(format_hms(int(now - self._boot_time)))
 
 
         # Update all plots and panels
@@ -519,313 +895,357 @@ class SystemMonitorDashboard:
         artists.extend(self.update_alert_panel()) # Update alert panel even if no new alerts (to clear old ones)
         artists.extend(self.update_summary_panel(metrics))
 
-        # When not using blit=True, FuncAnimation expects an iterable of artists, but returning
-        # an empty list works fine as matplotlib redraws the whole figure anyway.
-        # If using blit=True, you MUST return all modified artists.
-        return []
-def update_plot(self, ax, title, color, data_key, threshold_key=None, unit='%', is_network=False):
-        """Generic plot update returning list of artists modified (for blitting, though not used)."""
-        ax.clear() # Clear previous drawings
-        self.configure_plot(ax, title, color) # Reapply base configuration
-        artists = [] # Keep track of artists if blitting is desired later
-
-        times = self.metrics_history['time']
-        data = self.metrics_history[data_key]
-
-        if not times or not data: # No data yet
-             return artists
-
-        y_data = data
-        threshold_value = None
-        threshold_unit_multiplier = 1e6 if is_network else 1
-
-        if is_network:
-            y_data = [d / threshold_unit_multiplier for d in data] # Convert bytes to MB for plotting
-
-        # Threshold line and fill
-        if threshold_key and threshold_key in self.thresholds:
-            threshold_value = self.thresholds[threshold_key] / threshold_unit_multiplier # Threshold in plot units (e.g., MB)
-            line = ax.axhline(y=threshold_value, color=COLORS['threshold'], linestyle='--', alpha=0.7, linewidth=1.5, label=f'Threshold ({threshold_value:.1f}{unit})')
-            artists.append(line)
-
-            # Fill area above threshold
-            y_data_np = np.array(y_data)
-            fill = ax.fill_between(
-                times,
-                threshold_value,
-                y_data_np,
-                where=y_data_np > threshold_value,
-                color=COLORS['alert'], alpha=0.2, interpolate=True
-            )
-            # fill_between returns a PolyCollection, which is an Artist
-            if fill: artists.append(fill)
+        artists.extend(self.status_artists)
 
+        # New y-limits change tick labels outside the blitted regions, so repaint the whole
+        # figure once; the blit backgrounds are re-captured from this fresh render.
+        self.blitter.update(artists, full_redraw=self._needs_full_redraw)
+        self._needs_full_redraw = False
+        return artists
 
-        # Plot the main data line
-        line, = ax.plot(
-            times,
-            y_data,
-            color=color,
-            linewidth=2.0, # Slightly thinner line
-            marker='o',
-            markersize=4, # Slightly smaller marker
-            markerfacecolor=COLORS['background'],
-            markeredgecolor=color,
-            markeredgewidth=1.0,
-            path_effects=[path_effects.SimpleLineShadow(shadow_color='black', alpha=0.3), path_effects.Normal()],
-            label=f'Current: {y_data[-1]:.1f}{unit}' # Add current value to label
-        )
-        artists.append(line)
-
-        # Add value annotation near the last point
-        last_value = y_data[-1]
-        annotation = ax.annotate(
-            f'{last_value:.1f}{unit}',
-            xy=(len(times)-1, last_value), # Position based on index
-            xytext=(8, 0), # Offset pixels
-            textcoords='offset points',
-            color=color,
-            fontsize=9, # Smaller annotation
-            fontweight='bold',
-            bbox=dict(
-                boxstyle='round,pad=0.3',
-                fc=COLORS['panel'],
-                ec=color,
-                lw=1.0, # Thinner border
-                alpha=0.8 # Slightly more transparent
-            )
+    def timed_update(self):
+        """Timer callback: run update_dashboard and adapt the redraw interval to its cost."""
+        t0 = time.perf_counter()
+        self.update_dashboard()
+        frame_ms = self._frame_ms
+        frame_ms.append((time.perf_counter() - t0) * 1000)
+        self._frames += 1
+        if self._frames % ADAPT_EVERY == 0:
+            self.adapt_interval()
+
+    def adapt_interval(self):
+        """Stretch the redraw interval when frames get expensive and shrink it back when they don't."""
+        if not self.timer:
+            return
+        costs = sorted(self._frame_ms)
+        p95 = costs[int(0.95 * (len(costs) - 1))]
+        interval = self.timer.interval
+        if p95 * 2 > interval:
+            new_interval = min(MAX_INTERVAL_MS, int(p95 * 2.5))
+        elif p95 * 5 < interval and interval > self.update_interval:
+            new_interval = max(self.update_interval, int(p95 * 2.5))
+        else:
+            return
+        if new_interval != interval:
+            self.timer.interval = new_interval
+            self.refresh_text.set_text(f"{new_interval/1000:.1f}s")
+            logger.info("Redraw interval adapted to %d ms (p95 frame cost %.0f ms)", new_interval, p95)
+
+    @property
+    def history(self):
+        """Last max_data_points samples, oldest first, as a zero-copy view of the ring."""
+        return self._ring[self._head:self._head + self.max_data_points]
+
+    def push_sample(self, metrics):
+        """Append one metrics sample to the history ring in O(1)."""
+        row = (
+            metrics['timestamp'], metrics['cpu'], metrics['memory'], metrics['disk'],
+            metrics['network_sent'], metrics['network_recv'], min(metrics['process'], 0xFFFF)
         )
-        artists.append(annotation)
+        head = self._head
+        self._ring[head] = row
+        self._ring[head + self.max_data_points] = row
+        self._head = (head + 1) % self.max_data_points
+        self.history_count = min(self.history_count + 1, self.max_data_points)
+
+    def sample_loop(self):
+        """Sampler thread: queue metrics every update interval, then close the meminfo reader."""
+        try:
+            self._sample_until_stopped()
+        finally:
+            if self._meminfo:
+                self._meminfo.close() # No read() can follow: this is the only thread that reads
+
+    def _sample_until_stopped(self):
+        # psutil keeps cpu_percent(interval=None) state per thread, so prime it here, on the
+        # thread that reads it, and take the network baseline alongside; the first real sample
+        # follows a short fixed window, so neither reports a near-zero-length one
+        psutil.cpu_percent(percpu=False, interval=None)
+        self._last_net, self._last_net_time = psutil.net_io_counters(), time.monotonic()
+        self._stop_sampling.wait(FIRST_SAMPLE_S)
+        while not self._stop_sampling.is_set():
+            self._sampling_enabled.wait() # Blocks (no wakeups, no psutil calls) while paused
+            if self._stop_sampling.is_set():
+                break
+            self._samples.append(self.get_system_metrics()) # None marks a failed sample
+            self._first_sample.set()
+            self._stop_sampling.wait(self.update_interval / 1000)
+
+    def stop_sampling(self):
+        """Stop the sampler thread, waking it if it is parked by a pause."""
+        self._stop_sampling.set()
+        self._sampling_enabled.set()
+
+    def make_plot_updater(self, key, unit, y_floor):
+        """Build the per-frame update for a single-series panel."""
+        line = self.lines[key]
+        fill = self.fills[key]
+        value_text = self.value_texts[key]
+        thresholds = self.thresholds
+        x_index = self._x_index
+        label_fmt = '%.1f' + unit.replace('%', '%%')
+
+        def update():
+            count = self.history_count
+            if not count: # No data yet
+                return []
+
+            y_data = self.history[key][-count:] # View of the filled part of the history
+            x_data = x_index[:count]
+            threshold_value = thresholds[key]
+
+            # Fill area above threshold; the persistent PolyCollection only gets new vertices,
+            # and carries none while no sample is above the threshold
+            min_val = float(y_data.min())
+            max_val = float(y_data.max())
+            if max_val > threshold_value:
+                fill.set_verts([threshold_fill_verts(x_data, y_data, threshold_value)])
+            else:
+                fill.set_verts([])
 
-        # Adjust Y-axis limits dynamically (with padding)
-        if y_data:
-            min_val = min(y_data)
-            max_val = max(y_data)
+            line.set_data(x_data, y_data)
+
+            # Label with the unquantized latest sample
+            value_text.set_text(label_fmt % self.latest_metrics[key])
+
+            # Y-axis from 0 with padding above both the data and the threshold
             padding = (max_val - min_val) * 0.1 + 1 # Add small absolute padding too
-            y_min = 0 # Generally start Y axis at 0 for usage plots
-            y_max = max(max_val + padding, threshold_value + padding if threshold_value else 0)
-            # For percentage plots, cap max at slightly above 100 if threshold isn't higher
-            if unit == '%' and (not threshold_value or threshold_value <= 100):
-                 y_max = max(y_max, 105) # Ensure 100% is visible
-            elif is_network and (not threshold_value or threshold_value < 1):
-                 y_max = max(y_max, 1.0) # Ensure small MB values have some scale
-
-            ax.set_ylim(y_min, y_max)
-
-        # Add legend if threshold is present
-        #if threshold_key:
-        #    leg = ax.legend(loc='upper left', fontsize=8, facecolor=COLORS['panel'], edgecolor=color)
-        #    if leg: artists.extend(leg.get_texts())
-        #    if leg: artists.extend(leg.get_lines())
-        #    if leg: artists.append(leg.get_frame())
-
-        # Return artists for blitting if needed (currently not used)
-        return artists
+            self.set_ylim(key, 0, max(max_val + padding, threshold_value + padding, y_floor))
 
+            return [fill, line, value_text]
+
+        return update
 
     def update_cpu_plot(self):
-        return self.update_plot(self.axes['cpu'], 'CPU USAGE (%)', COLORS['cpu'], 'cpu', 'cpu', '%')
+        return self.plot_updaters['cpu']()
 
     def update_memory_plot(self):
-        return self.update_plot(self.axes['memory'], 'MEMORY USAGE (%)', COLORS['memory'], 'memory', 'memory', '%')
+        return self.plot_updaters['memory']()
 
     def update_disk_plot(self):
-        return self.update_plot(self.axes['disk'], 'DISK USAGE (%)', COLORS['disk'], 'disk', 'disk', '%')
+        return self.plot_updaters['disk']()
 
     def update_process_plot(self):
-        return self.update_plot(self.axes['process'], 'ACTIVE PROCESSES', COLORS['process'], 'process', 'process', '')
+        return self.plot_updaters['process']()
 
 
     def update_network_plot(self):
         """Update network plot with Sent/Received lines and threshold."""
-        ax = self.axes['network']
-        ax.clear()
-        self.configure_plot(ax, 'NETWORK TRAFFIC (Total MB)', COLORS['network']) # Clarify Total
         artists = []
-        times = self.metrics_history['time']
+        count = self.history_count
 
-        if not times: return artists
+        if not count: return artists
 
         threshold_mb = self.thresholds['network'] / 1e6
 
-        # Threshold line
-        line_thresh = ax.axhline(y=threshold_mb, color=COLORS['threshold'], linestyle='--', alpha=0.7, linewidth=1.5, label=f'Threshold ({threshold_mb:.1f} MB)')
-        artists.append(line_thresh)
-
         max_val = 0 # Track max value for Y-axis scaling
+        x_data = self._x_index[:count]
 
         # Plot sent data if enabled
+        line_sent = self.lines['network_sent']
+        label_sent = self.network_labels['sent']
+        line_sent.set_visible(self.show_network_sent)
+        label_sent.set_visible(self.show_network_sent)
         if self.show_network_sent:
-            sent_mb = [x/1e6 for x in self.metrics_history['network_sent']]
-            if sent_mb: max_val = max(max_val, max(sent_mb))
-            line_sent, = ax.plot(
-                times, sent_mb,
-                color=COLORS['network'], linewidth=2.0, label=f'Sent: {sent_mb[-1]:.1f} MB' if sent_mb else 'Sent',
-                marker='^', markersize=4, markerfacecolor=COLORS['background'], markeredgecolor=COLORS['network']
-            )
-            artists.append(line_sent)
+            sent_mb = np.multiply(self.history['network_sent'][-count:], 1e-6, out=self._net_mb['sent'][:count])
+            max_val = max(max_val, float(sent_mb.max()))
+            line_sent.set_data(x_data, sent_mb)
+            label_sent.set_text('▲ Sent: %.2f MB/s' % sent_mb[-1])
+        artists.extend((line_sent, label_sent))
 
         # Plot received data if enabled
+        line_recv = self.lines['network_recv']
+        label_recv = self.network_labels['recv']
+        line_recv.set_visible(self.show_network_recv)
+        label_recv.set_visible(self.show_network_recv)
         if self.show_network_recv:
-            recv_mb = [x/1e6 for x in self.metrics_history['network_recv']]
-            if recv_mb: max_val = max(max_val, max(recv_mb))
-            line_recv, = ax.plot(
-                times, recv_mb,
-                color=COLORS['accent'], linewidth=2.0, label=f'Recv: {recv_mb[-1]:.1f} MB' if recv_mb else 'Recv',
-                marker='v', markersize=4, markerfacecolor=COLORS['background'], markeredgecolor=COLORS['accent']
-            )
-            artists.append(line_recv)
+            recv_mb = np.multiply(self.history['network_recv'][-count:], 1e-6, out=self._net_mb['recv'][:count])
+            max_val = max(max_val, float(recv_mb.max()))
+            line_recv.set_data(x_data, recv_mb)
+            label_recv.set_text('▼ Recv: %.2f MB/s' % recv_mb[-1])
+        artists.extend((line_recv, label_recv))
 
         # Adjust Y-axis limits
         padding = max_val * 0.1 + 0.5 # Add some padding
-        ax.set_ylim(0, max(max_val + padding, threshold_mb + padding))
-
-        # Add legend if any data is shown
-        if self.show_network_sent or self.show_network_recv:
-            leg = ax.legend(
-                loc='upper left',
-                facecolor=COLORS['panel'],
-                edgecolor=COLORS['text'], # Use text color for legend border
-                fontsize=8 # Smaller legend font
-            )
-            if leg: # Add legend artists if blitting
-                artists.extend(leg.get_texts())
-                artists.extend(leg.get_lines())
-                artists.append(leg.get_frame())
+        self.set_ylim('network', 0, max(max_val + padding, threshold_mb + padding))
 
         return artists
 
 
     def update_alert_panel(self):
         """Update the alert panel text."""
-        ax = self.axes['alert']
-        ax.clear() # Clear previous text
-        ax.set_title('ALERTS', color=COLORS['alert'], pad=10, fontsize=12, fontweight='bold')
-        ax.axis('off') # Keep axis off
-        artists = [] # For blitting if needed
-
+        if not self._alerts_changed:
+            return [] # Unchanged: leave the panel's pixels alone
+        self._alerts_changed = False
+        block = self.alert_block
         if self.alerts:
-            # Display newest alerts at the top
-            for i, (timestamp, alert) in enumerate(reversed(self.alerts)): # Show last 8, newest first
-                 txt = ax.text(
-                    0.02, 0.95 - i*0.11, # Adjust vertical spacing
-                    f"• {timestamp} - {alert}",
-                    color=COLORS['alert'],
-                    fontsize=9,
-                    fontweight='normal', # Normal weight for alerts
-                    transform=ax.transAxes, # Use axis coordinates
-                    verticalalignment='top' # Align text from top
-                 )
-                 artists.append(txt)
+            # Newest alerts at the top
+            text = "\n".join(f"• {timestamp} - {message % args}" for timestamp, message, args in reversed(self.alerts))
         else:
-            txt = ax.text(
-                0.5, 0.5,
-                "NO ACTIVE ALERTS",
-                color=COLORS['success'],
-                ha='center',
-                va='center',
-                fontsize=11,
-                fontweight='bold',
-                transform=ax.transAxes
-            )
-            artists.append(txt)
-        return artists
+            text = "NO ACTIVE ALERTS"
+        block.set_text(text)
+        if self.alerts:
+            block.set_position((0.02, 0.95))
+            block.set(color=_ALERT_COLOR, ha='left', va='top', fontsize=9, fontweight='normal', family='monospace')
+        else:
+            block.set_position((0.5, 0.5))
+            block.set(color=_SUCCESS_COLOR, ha='center', va='center', fontsize=11, fontweight='bold', family='sans-serif')
+        return [block]
 
 
-    def update_summary_panel(self, metrics):
-        """Update the system summary panel."""
+    def build_summary_panel(self):
+        """Lay out the summary panel once: static headings and hardware lines, plus value texts."""
         ax = self.axes['summary']
-        ax.clear()
-        ax.set_title('SYSTEM SUMMARY', color=COLORS['accent'], pad=10, fontsize=12, fontweight='bold')
-        ax.axis('off')
-        artists = []
-
-        # System info (collected less frequently might be better, but ok here)
-        try:
-            cpu_count = psutil.cpu_count(logical=False)
-            cpu_logical = psutil.cpu_count(logical=True)
-            memory_total_gb = round(psutil.virtual_memory().total / (1024**3), 1)
-            disk_total_gb = round(psutil.disk_usage('/').total / (1024**3), 1)
-            memory_used_gb = round(psutil.virtual_memory().used / (1024**3), 1)
-            disk_used_gb = round(psutil.disk_usage('/').used / (1024**3), 1)
-        except Exception as e:
-            logging.error(f"Error getting static system info: {e}")
-            cpu_count, cpu_logical, memory_total_gb, disk_total_gb = 'N/A', 'N/A', 'N/A', 'N/A'
-            memory_used_gb, disk_used_gb = 'N/A', 'N/A'
-
-
-        # Format network values safely in case metrics is None briefly
-        net_sent_mb = metrics['network_sent'] / 1e6 if metrics else 0
-        net_recv_mb = metrics['network_recv'] / 1e6 if metrics else 0
-
+        hw = self._hardware_info
+        # (title, fixed lines, number of per-frame value lines)
         sections = [
             ("HARDWARE INFO", [
-                f"CPU Cores: {cpu_count} physical, {cpu_logical} logical",
-                f"Total Memory: {memory_total_gb} GB",
-                f"Total Disk (/): {disk_total_gb} GB"
-            ]),
-            ("CURRENT STATUS", [
-                f"CPU Usage: {metrics['cpu']:.1f}%" if metrics else 'N/A',
-                f"Memory Usage: {metrics['memory']:.1f}% ({memory_used_gb} GB)" if metrics else 'N/A',
-                f"Disk Usage (/): {metrics['disk']:.1f}% ({disk_used_gb} GB)" if metrics else 'N/A',
-                f"Active Processes: {metrics['process']}" if metrics else 'N/A',
-                f"Network Total: ↑{net_sent_mb:.1f}MB / ↓{net_recv_mb:.1f}MB"
-            ]),
-            ("ALERT HISTORY", [
-                f"Total Alerts Logged: {len(self.alert_history)}",
-                f"Last Alert Time: {self.alert_history[-1][0] if self.alert_history else 'None'}"
-            ])
+                f"CPU Cores: {hw.cpu_physical} physical, {hw.cpu_logical} logical",
+                f"Total Memory: {hw.memory_total_gb} GB",
+                f"Total Disk (/): {hw.disk_total_gb} GB"
+            ], 0),
+            ("CURRENT STATUS", [], 5), # CPU, memory, disk, processes, network
+            ("ALERT HISTORY", [], 2), # Total alerts, last alert time
         ]
 
-        base_y = 0.95
-        section_spacing = 0.32 # Space between sections
-        item_spacing = 0.06 # Space between items in a section
-
-        for i, (title, items) in enumerate(sections):
-            section_y = base_y - i * section_spacing
-            # Section Title
-            txt_title = ax.text(0.02, section_y, title, color=COLORS['accent'], fontsize=10, fontweight='bold', transform=ax.transAxes, va='top')
-            artists.append(txt_title)
-
-            # Section Items
-            for j, item in enumerate(items):
-                item_y = section_y - 0.06 - j * item_spacing # Position items below title
-                txt_item = ax.text(0.05, item_y, item, color=COLORS['text'], fontsize=9, transform=ax.transAxes, va='top')
-                artists.append(txt_item)
-        return artists
+        # Flat layout computed up front: one (x, y, text, style, is_value) entry per line.
+        # Each section starts a fixed gap below the previous section's last line, so
+        # longer sections push the next one down instead of overlapping it.
+        y = 0.95
+        item_spacing = 0.06 # Space between lines in a section
+        section_gap = 0.14 # Space from a section's last line to the next title
+        layout = []
+        for title, fixed_lines, value_count in sections:
+            layout.append((0.02, y, title, 'title', False))
+            lines = fixed_lines + [''] * value_count
+            for j, item in enumerate(lines):
+                y -= item_spacing
+                layout.append((0.05, y, item, 'item', j >= len(fixed_lines)))
+            y -= section_gap
+
+        styles = {
+            'title': dict(color=_ACCENT_COLOR, fontsize=10, fontweight='bold'),
+            'item': dict(color=_TEXT_COLOR, fontsize=9),
+        }
+        self.summary_texts = [] # Only these are updated per frame
+        self._summary_inputs = None # Inputs the value texts were last formatted from
+        for x, y, text, style, is_value in layout:
+            artist = ax.text(x, y, text, transform=ax.transAxes, va='top', **styles[style])
+            if is_value:
+                self.summary_texts.append(artist)
+
+    def update_summary_panel(self, metrics):
+        """Re-format only the summary lines whose inputs changed."""
+        if metrics:
+            inputs = (
+                (round(metrics['cpu'], 1),),
+                (round(metrics['memory'], 1), round(metrics['memory_used'] / (1024**3), 1)),
+                (round(metrics['disk'], 1), round(metrics['disk_used'] / (1024**3), 1)),
+                (metrics['process'],),
+                (round(metrics['network_sent'] / 1e6, 2), round(metrics['network_recv'] / 1e6, 2)),
+            )
+        else:
+            inputs = (None,) * 4 + ((0.0, 0.0),)
+        inputs += ((self.alert_count,), (self.last_alert_time or 'None',))
+
+        previous = self._summary_inputs
+        if inputs == previous:
+            return [] # Unchanged: leave the panel's pixels alone
+        self._summary_inputs = inputs
+        for i, (text, fmt, values) in enumerate(zip(self.summary_texts, SUMMARY_LINE_FORMATS, inputs)):
+            if previous is None or values != previous[i]:
+                text.set_text('N/A' if values is None else fmt % values)
+        # All value texts share the panel's blit region, so they are redrawn together
+        return self.summary_texts
+
+
+    def export_replay(self, filename='dashboard_replay.gif', interval=200):
+        """Save the buffered history as a replay animation; returns the filename, or None if empty."""
+        count = self.history_count
+        if not count:
+            logger.warning("Replay export skipped: no samples collected yet")
+            return None
+
+        history = self.history[-count:].copy() # Snapshot of the filled rows
+        x_data = np.arange(count)
+        fig, axes = plt.subplots(len(PLOT_PANELS), 1, sharex=True, figsize=(8, 2.2 * len(PLOT_PANELS)),
+                                 facecolor=COLORS['background'])
+        panels = []
+        for ax, (key, title) in zip(axes, PLOT_PANELS):
+            self.configure_plot(ax, title, COLORS[key])
+            if key == 'network':
+                columns = [(history['network_sent'] / 1e6, COLORS['network']),
+                           (history['network_recv'] / 1e6, COLORS['accent'])]
+            else:
+                columns = [(history[key], COLORS[key])]
+            ax.set_xlim(0, self.max_data_points - 1)
+            ax.set_ylim(0, max(float(y.max()) for y, _ in columns) * 1.1 + 1)
+            panels.append((ax, columns))
+
+        frames = []
+        for i in range(1, count + 1):
+            frame = []
+            for ax, columns in panels:
+                for y_data, color in columns:
+                    line, = ax.plot(x_data[:i], y_data[:i], color=color, linewidth=2.0)
+                    frame.append(line)
+            frames.append(frame)
+
+        replay = ArtistAnimation(fig, frames, interval=interval, blit=True, repeat=False)
+        replay.save(filename)
+        plt.close(fig)
+        logger.info("Replay of %d samples exported to %s", count, filename)
+        return filename
 
 
     def run(self):
-        """Start the dashboard animation."""
+        """Start the dashboard refresh loop and show the window."""
         try:
-            self.animation = FuncAnimation(
-                self.fig,
-                self.update_dashboard,
-                frames=None, # Keep generating frames indefinitely
-                interval=self.update_interval,
-                blit=False, # Blitting is complex with dynamic text/layouts and widgets
-                cache_frame_data=False, # Avoid memory leak with long runs
-                repeat=False # Don't repeat animation
-            )
+            # Plain canvas timer driving update_dashboard; BlitManager does the incremental drawing
+            self.timer = self.fig.canvas.new_timer(interval=self.update_interval)
+            self.timer.add_callback(self.timed_update)
+            self.timer.start()
             plt.show()
-            logging.info("Dashboard stopped")
+            logger.info("Dashboard stopped")
         except Exception as e:
-            logging.critical(f"Dashboard runtime error: {str(e)}", exc_info=True)
+            logger.critical("Dashboard runtime error: %s", e, exc_info=True)
             print(f"A critical error occurred: {e}. Check system_monitor.log for details.")
             # Optional: Try to clean up plot window if possible
             try:
                 plt.close(self.fig)
             except Exception:
                 pass # Ignore errors during cleanu
+        finally:
+            self.shutdown() # Also covers Ctrl+C, which is not an Exception
+
+    def shutdown(self, event=None):
+        """Stop the timers and sampler and drop the blit caches; safe to call more than once."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        for timer in (self.timer, self._draw_timer, self._slider_timer):
+            if timer is not None:
+                timer.stop()
+        self.stop_sampling()
+        # The sampler wakes at once and closes the meminfo fd on exit; wait for it briefly
+        self._sampler.join(timeout=1.0)
+        self.blitter.disconnect()
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(levelname)s] %(message)s'
+    )
+    alert_file = logging.handlers.RotatingFileHandler('alerts.log', maxBytes=1_000_000, backupCount=3)
+    alert_file.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+    alert_logger.addHandler(alert_file)
     print("Starting System Monitor Dashboard...")
     print("Check system_monitor.log for detailed activity.")
     try:
         dashboard = SystemMonitorDashboard()
         dashboard.run()
     except Exception as e:
-        logging.critical(f"Fatal error during dashboard initialization or run: {str(e)}", exc_info=True)
+        logger.critical("Fatal error during dashboard initialization or run: %s", e, exc_info=True)
         print(f"\nFATAL ERROR: {str(e)}")
         print("The application could not start. Please check system_monitor.log for details.")
         # Keep console open briefly to show error